@@ -0,0 +1,43 @@
+import base64
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+import jwt
+import orjson
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+def decode_hs256(token: str, key: Optional[bytes]) -> dict:
+    # Verify HS256 tokens with a single HMAC instead of going through jwt.decode's
+    # per-call algorithm lookup; mirrors PyJWT's checks and exceptions.
+    if not key:
+        # Never HMAC with an empty key: anyone could sign tokens with it
+        raise jwt.InvalidTokenError("JWT secret is not configured")
+    if token.count('.') != 2:
+        raise jwt.DecodeError("Not enough segments")
+    signing_input, _, signature = token.rpartition('.')
+    header_b64, _, payload_b64 = signing_input.partition('.')
+    try:
+        header = orjson.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature)
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        signing_input = signing_input.encode('ascii')
+    except ValueError:
+        raise jwt.DecodeError("Invalid token encoding")
+    if not isinstance(header, dict) or header.get('alg') != 'HS256':
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    expected = hmac.new(key, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    exp = payload.get('exp')
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        raise jwt.MissingRequiredClaimError('exp')
+    if exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import httpx
 import sys
 import json
 from datetime import datetime
@@ -12,50 +13,53 @@ class TaskWeaverAPITester:
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self._lock = asyncio.Lock()
+        self.client = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_keepalive_connections=16),
+            timeout=30
+        )
+
+    def set_token(self, token):
+        """Store the auth token and attach it to the shared client"""
+        self.token = token
+        self.client.headers['Authorization'] = f'Bearer {token}'
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        await self.client.aclose()
 
-    def log_test(self, name, success, details=""):
+    async def log_test(self, name, success, details=""):
         """Log test result"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED")
-        else:
-            print(f"❌ {name} - FAILED: {details}")
-        
-        self.test_results.append({
-            "test": name,
-            "success": success,
-            "details": details
-        })
+        async with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                print(f"✅ {name} - PASSED")
+            else:
+                print(f"❌ {name} - FAILED: {details}")
+            
+            self.test_results.append({
+                "test": name,
+                "success": success,
+                "details": details
+            })
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
+    async def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
         """Run a single API test"""
         url = f"{self.api_url}/{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
-        
-        if self.token:
-            test_headers['Authorization'] = f'Bearer {self.token}'
-        
-        if headers:
-            test_headers.update(headers)
 
         print(f"\n🔍 Testing {name}...")
         print(f"   URL: {url}")
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers)
+            response = await self.client.request(method, endpoint, json=data, headers=headers)
 
             success = response.status_code == expected_status
             
             if success:
-                self.log_test(name, True)
+                await self.log_test(name, True)
                 try:
                     return True, response.json()
                 except:
@@ -68,14 +72,24 @@ class TaskWeaverAPITester:
                 except:
                     error_msg += f" - {response.text}"
                 
-                self.log_test(name, False, error_msg)
+                await self.log_test(name, False, error_msg)
                 return False, {}
 
         except Exception as e:
-            self.log_test(name, False, f"Exception: {str(e)}")
+            await self.log_test(name, False, f"Exception: {str(e)}")
             return False, {}
 
-    def test_auth_register(self):
+    async def run_batch(self, name, items, expected_status=200, concurrent=False):
+        """Run several API operations in a single /api/batch round trip"""
+        endpoint = "batch?concurrent=true" if concurrent else "batch"
+        success, results = await self.run_test(name, "POST", endpoint, expected_status, data=items)
+        if success and any(r.get('status') != 200 for r in results):
+            failed = [r for r in results if r.get('status') != 200]
+            await self.log_test(f"{name} - Items", False, f"{len(failed)} item(s) failed: {failed}")
+            return False, results
+        return success, results
+
+    async def test_auth_register(self):
         """Test user registration"""
         timestamp = datetime.now().strftime('%H%M%S')
         test_user = {
@@ -84,7 +98,7 @@ class TaskWeaverAPITester:
             "password": "TestPass123!"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Registration",
             "POST",
             "auth/register",
@@ -93,19 +107,19 @@ class TaskWeaverAPITester:
         )
         
         if success and 'token' in response:
-            self.token = response['token']
+            self.set_token(response['token'])
             self.user_id = response['user']['id']
             return True, test_user
         return False, {}
 
-    def test_auth_login(self, user_data):
+    async def test_auth_login(self, user_data):
         """Test user login"""
         login_data = {
             "email": user_data["email"],
             "password": user_data["password"]
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "User Login",
             "POST",
             "auth/login",
@@ -114,13 +128,13 @@ class TaskWeaverAPITester:
         )
         
         if success and 'token' in response:
-            self.token = response['token']
+            self.set_token(response['token'])
             return True
         return False
 
-    def test_auth_me(self):
+    async def test_auth_me(self):
         """Test get current user"""
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Get Current User",
             "GET",
             "auth/me",
@@ -128,7 +142,7 @@ class TaskWeaverAPITester:
         )
         return success
 
-    def test_create_board(self):
+    async def test_create_board(self):
         """Test board creation"""
         board_data = {
             "title": "Test Board",
@@ -136,7 +150,7 @@ class TaskWeaverAPITester:
             "background": "#e3f2fd"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Create Board",
             "POST",
             "boards",
@@ -146,9 +160,9 @@ class TaskWeaverAPITester:
         
         return response.get('id') if success else None
 
-    def test_get_boards(self):
+    async def test_get_boards(self):
         """Test get user boards"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Boards",
             "GET",
             "boards",
@@ -156,9 +170,9 @@ class TaskWeaverAPITester:
         )
         return success, response
 
-    def test_get_board(self, board_id):
+    async def test_get_board(self, board_id):
         """Test get specific board"""
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Get Board Details",
             "GET",
             f"boards/{board_id}",
@@ -166,7 +180,7 @@ class TaskWeaverAPITester:
         )
         return success
 
-    def test_create_list(self, board_id):
+    async def test_create_list(self, board_id):
         """Test list creation"""
         list_data = {
             "title": "Test List",
@@ -174,7 +188,7 @@ class TaskWeaverAPITester:
             "position": 0
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Create List",
             "POST",
             "lists",
@@ -184,9 +198,9 @@ class TaskWeaverAPITester:
         
         return response.get('id') if success else None
 
-    def test_get_lists(self, board_id):
+    async def test_get_lists(self, board_id):
         """Test get board lists"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Lists",
             "GET",
             f"lists/{board_id}",
@@ -194,7 +208,7 @@ class TaskWeaverAPITester:
         )
         return success, response
 
-    def test_create_card(self, list_id, board_id):
+    async def test_create_card(self, list_id, board_id):
         """Test card creation"""
         card_data = {
             "title": "Test Card",
@@ -205,7 +219,7 @@ class TaskWeaverAPITester:
             "priority": "medium"
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Create Card",
             "POST",
             "cards",
@@ -215,9 +229,9 @@ class TaskWeaverAPITester:
         
         return response.get('id') if success else None
 
-    def test_get_cards(self, board_id):
+    async def test_get_cards(self, board_id):
         """Test get board cards"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Cards",
             "GET",
             f"cards/{board_id}",
@@ -225,7 +239,20 @@ class TaskWeaverAPITester:
         )
         return success, response
 
-    def test_update_card(self, card_id):
+    async def test_batch_reads(self, board_id):
+        """Test batched board, list and card reads"""
+        success, results = await self.run_batch(
+            "Batch Reads",
+            [
+                {"method": "GET", "path": f"boards/{board_id}"},
+                {"method": "GET", "path": f"lists/{board_id}"},
+                {"method": "GET", "path": f"cards/{board_id}"}
+            ],
+            concurrent=True
+        )
+        return success
+
+    async def test_update_card(self, card_id):
         """Test card update"""
         update_data = {
             "title": "Updated Test Card",
@@ -233,7 +260,7 @@ class TaskWeaverAPITester:
             "priority": "high"
         }
         
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Update Card",
             "PUT",
             f"cards/{card_id}",
@@ -242,9 +269,9 @@ class TaskWeaverAPITester:
         )
         return success
 
-    def test_get_inbox(self):
+    async def test_get_inbox(self):
         """Test unified inbox"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Inbox",
             "GET",
             "inbox",
@@ -252,13 +279,13 @@ class TaskWeaverAPITester:
         )
         return success, response
 
-    def test_ai_extract_tasks(self):
+    async def test_ai_extract_tasks(self):
         """Test AI task extraction"""
         extract_data = {
             "text": "I need to prepare for the meeting tomorrow at 2 PM. Also, don't forget to send the quarterly report to the team by Friday. Call the client about the project update."
         }
         
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "AI Task Extraction",
             "POST",
             "ai/extract-tasks",
@@ -274,13 +301,13 @@ class TaskWeaverAPITester:
                     print(f"      Task {i+1}: {task.get('title', 'No title')}")
                 return True
             else:
-                self.log_test("AI Task Extraction - Task Count", False, "No tasks extracted")
+                await self.log_test("AI Task Extraction - Task Count", False, "No tasks extracted")
                 return False
         return False
 
-    def test_delete_card(self, card_id):
+    async def test_delete_card(self, card_id):
         """Test card deletion"""
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Delete Card",
             "DELETE",
             f"cards/{card_id}",
@@ -288,9 +315,9 @@ class TaskWeaverAPITester:
         )
         return success
 
-    def test_delete_list(self, list_id):
+    async def test_delete_list(self, list_id):
         """Test list deletion"""
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Delete List",
             "DELETE",
             f"lists/{list_id}",
@@ -298,9 +325,9 @@ class TaskWeaverAPITester:
         )
         return success
 
-    def test_delete_board(self, board_id):
+    async def test_delete_board(self, board_id):
         """Test board deletion"""
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Delete Board",
             "DELETE",
             f"boards/{board_id}",
@@ -308,88 +335,94 @@ class TaskWeaverAPITester:
         )
         return success
 
-def main():
+async def main():
     print("🚀 Starting TaskWeaver API Tests")
     print("=" * 50)
     
     tester = TaskWeaverAPITester()
-    
+    try:
+        return await run_suite(tester)
+    finally:
+        await tester.close()
+
+async def run_suite(tester):
     # Test Authentication Flow
     print("\n📝 Testing Authentication...")
-    success, user_data = tester.test_auth_register()
+    success, user_data = await tester.test_auth_register()
     if not success:
         print("❌ Registration failed, stopping tests")
         return 1
     
-    if not tester.test_auth_login(user_data):
+    if not await tester.test_auth_login(user_data):
         print("❌ Login failed, stopping tests")
         return 1
     
-    if not tester.test_auth_me():
+    if not await tester.test_auth_me():
         print("❌ Get current user failed")
         return 1
     
-    # Test Board Management
+    # Create the resources the remaining tests depend on
     print("\n📋 Testing Board Management...")
-    board_id = tester.test_create_board()
+    board_id = await tester.test_create_board()
     if not board_id:
         print("❌ Board creation failed, stopping tests")
         return 1
     
-    if not tester.test_get_board(board_id):
-        print("❌ Get board failed")
-        return 1
-    
-    success, boards = tester.test_get_boards()
-    if not success:
-        print("❌ Get boards failed")
-        return 1
-    
-    # Test List Management
     print("\n📝 Testing List Management...")
-    list_id = tester.test_create_list(board_id)
+    list_id = await tester.test_create_list(board_id)
     if not list_id:
         print("❌ List creation failed, stopping tests")
         return 1
     
-    success, lists = tester.test_get_lists(board_id)
-    if not success:
-        print("❌ Get lists failed")
-        return 1
-    
-    # Test Card Management
     print("\n🃏 Testing Card Management...")
-    card_id = tester.test_create_card(list_id, board_id)
+    card_id = await tester.test_create_card(list_id, board_id)
     if not card_id:
         print("❌ Card creation failed, stopping tests")
         return 1
     
-    success, cards = tester.test_get_cards(board_id)
-    if not success:
+    # Read-only checks have no dependency on each other, run them together
+    print("\n📥 Testing Reads (boards, lists, cards, inbox)...")
+    board_ok, (boards_ok, boards), (lists_ok, lists), (cards_ok, cards), (inbox_ok, inbox_cards) = await asyncio.gather(
+        tester.test_get_board(board_id),
+        tester.test_get_boards(),
+        tester.test_get_lists(board_id),
+        tester.test_get_cards(board_id),
+        tester.test_get_inbox()
+    )
+    if not board_ok:
+        print("❌ Get board failed")
+        return 1
+    if not boards_ok:
+        print("❌ Get boards failed")
+        return 1
+    if not lists_ok:
+        print("❌ Get lists failed")
+        return 1
+    if not cards_ok:
         print("❌ Get cards failed")
         return 1
+    if not inbox_ok:
+        print("❌ Get inbox failed")
+        return 1
     
-    if not tester.test_update_card(card_id):
-        print("❌ Update card failed")
+    if not await tester.test_batch_reads(board_id):
+        print("❌ Batch reads failed")
         return 1
     
-    # Test Inbox
-    print("\n📥 Testing Inbox...")
-    success, inbox_cards = tester.test_get_inbox()
-    if not success:
-        print("❌ Get inbox failed")
+    if not await tester.test_update_card(card_id):
+        print("❌ Update card failed")
         return 1
     
     # Test AI Integration
     print("\n🤖 Testing AI Integration...")
-    if not tester.test_ai_extract_tasks():
+    if not await tester.test_ai_extract_tasks():
         print("❌ AI task extraction failed")
     
     # Cleanup Tests
     print("\n🗑️ Testing Cleanup Operations...")
-    tester.test_delete_card(card_id)
-    tester.test_delete_list(list_id)
-    tester.test_delete_board(board_id)
+    await tester.test_delete_card(card_id)
+    await tester.test_delete_list(list_id)
+    await tester.test_delete_board(board_id)
     
     # Print Results
     print("\n" + "=" * 50)
@@ -403,4 +436,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
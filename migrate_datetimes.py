@@ -0,0 +1,58 @@
+"""One-off migration: convert legacy ISO-string timestamps to BSON dates.
+
+Documents written before the server switched to native datetimes store
+created_at / updated_at / due_date as ISO strings. Mongo compares and sorts
+strings and dates as different types, so those documents are skipped by the
+inbox `before` filter and misordered by the created_at sort until converted.
+
+Run once against each deployment after upgrading:
+
+    python migrate_datetimes.py
+"""
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+DATE_FIELDS = {
+    "users": ["created_at"],
+    "boards": ["created_at", "updated_at"],
+    "lists": ["created_at"],
+    "cards": ["created_at", "updated_at", "due_date"],
+}
+
+def parse_legacy_date(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def migrate_collection(collection, fields) -> int:
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    updates = []
+    for doc in collection.find(query, {field: 1 for field in fields}):
+        converted = {
+            field: parse_legacy_date(doc[field])
+            for field in fields
+            if isinstance(doc.get(field), str) and doc[field]
+        }
+        if converted:
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": converted}))
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+    return len(updates)
+
+def main():
+    load_dotenv(Path(__file__).parent / '.env')
+    client = MongoClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    try:
+        for name, fields in DATE_FIELDS.items():
+            print(f"{name}: converted {migrate_collection(db[name], fields)} document(s)")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,84 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List as ListType, Optional, Dict, Any
+from urllib.parse import parse_qsl
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, ValidationError
+from typing import List as ListType, Optional, Dict, Any, AsyncIterator
 import uuid
+import hashlib
+import time
+import asyncio
+import inspect
 from datetime import datetime, timezone, timedelta
 import bcrypt
 import jwt
+import orjson
+from cachetools import TLRUCache
 from emergentintegrations.llm.chat import LlmChat, UserMessage
+from auth_tokens import decode_hs256
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app
-app = FastAPI()
-api_router = APIRouter(prefix="/api")
+class ORJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
 
-security = HTTPBearer()
+class ORJSONRoute(APIRoute):
+    # Parse JSON request bodies with orjson instead of the stdlib decoder
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request):
+            return await handler(ORJSONRequest(request.scope, request.receive))
+        return route_handler
+
+# Create the main app
+app = FastAPI(default_response_class=ORJSONResponse)
+api_router = APIRouter(prefix="/api", route_class=ORJSONRoute)
 
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET')
 JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'HS256')
 JWT_EXPIRATION = int(os.environ.get('JWT_EXPIRATION_HOURS', '168'))
+_JWT_KEY = JWT_SECRET.encode('utf-8') if JWT_SECRET else None
+
+INBOX_MAX_LIMIT = 10000
+AI_CACHE_TTL = 7 * 24 * 3600
+BATCH_MAX_ITEMS = 50
+BATCH_MAX_CONCURRENCY = 8
+BULK_CARDS_MAX = 100
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+
+# Authenticated users keyed by raw bearer token, so repeat calls skip the JWT decode and user lookup.
+# Entries are (user, exp) and expire after USER_CACHE_TTL seconds or at the token's exp, whichever is first.
+USER_CACHE_TTL = 300
+
+def _user_cache_expiry(_token: str, entry: tuple, now: float) -> float:
+    exp = entry[1]
+    return min(now + USER_CACHE_TTL, exp) if exp is not None else now + USER_CACHE_TTL
+
+_user_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_user_cache_expiry, timer=time.time)
 
 # Models
 class User(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     email: EmailStr
     name: str
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -56,7 +98,7 @@ class TokenResponse(BaseModel):
 
 class Board(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     description: Optional[str] = None
     owner_id: str
@@ -72,7 +114,7 @@ class BoardCreate(BaseModel):
 
 class List(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     board_id: str
     position: int
@@ -85,7 +127,7 @@ class ListCreate(BaseModel):
 
 class Card(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str
     description: Optional[str] = None
     list_id: str
@@ -100,6 +142,21 @@ class Card(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class CardSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    title: str
+    description: Optional[str] = None
+    list_id: str
+    board_id: str
+    position: int
+    due_date: Optional[datetime] = None
+    priority: Optional[str] = "medium"
+    created_at: datetime
+    updated_at: datetime
+
+CARD_SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in CardSummary.model_fields}}
+
 class CardCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -125,7 +182,7 @@ class CardUpdate(BaseModel):
 
 class Activity(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     board_id: str
     card_id: Optional[str] = None
@@ -137,9 +194,26 @@ class AIExtractRequest(BaseModel):
     text: str
     board_id: Optional[str] = None
 
+class ExtractedTask(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    title: str = Field(min_length=1)
+    description: Optional[str] = None
+    priority: Optional[str] = None
+
+EXTRACTED_TASKS_ADAPTER = TypeAdapter(ListType[ExtractedTask])
+
+class BatchItem(BaseModel):
+    method: str
+    path: str  # Relative to /api, e.g. "/lists/{board_id}"
+    body: Any = None
+
+class BatchResult(BaseModel):
+    status: int
+    body: Any = None
+
 # Helper Functions
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
@@ -151,24 +225,101 @@ def create_token(user_id: str) -> str:
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-def decode_token(token: str) -> str:
+def decode_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload['user_id']
+        if JWT_ALGORITHM == 'HS256':
+            payload = decode_hs256(token, _JWT_KEY)
+        else:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    token = credentials.credentials
-    user_id = decode_token(token)
-    user_doc = await db.users.find_one({"id": user_id}, {"_id": 0})
+async def authenticate_token(token: str) -> User:
+    cached = _user_cache.get(token)
+    if cached is not None:
+        return cached[0]
+    
+    payload = decode_token(token)
+    user_doc = await db.users.find_one({"id": payload['user_id']}, {"_id": 0})
     if not user_doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    if isinstance(user_doc.get('created_at'), str):
-        user_doc['created_at'] = datetime.fromisoformat(user_doc['created_at'])
-    return User(**user_doc)
+    user = User(**user_doc)
+    _user_cache[token] = (user, payload.get('exp'))
+    return user
+
+class BearerAuthMiddleware:
+    # Resolves the bearer token once per /api request and stores the user (or the
+    # auth failure) on request.state, so routes don't re-parse the header.
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api"):
+            state = scope.setdefault("state", {})
+            state["user"] = None
+            state["auth_error"] = None
+            authorization = next((v for k, v in scope["headers"] if k == b"authorization"), b"")
+            scheme, _, token = authorization.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    state["user"] = await authenticate_token(token)
+                except HTTPException as e:
+                    state["auth_error"] = e
+        await self.app(scope, receive, send)
+
+async def current_user_from_state(request: Request) -> User:
+    user = request.state.user
+    if user is None:
+        raise request.state.auth_error or HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated")
+    return user
+
+async def get_member_board_ids(user_id: str) -> ListType[str]:
+    return await db.boards.distinct("id", {"members": user_id})
+
+async def iter_board_items(board_id: str, user_id: str, collection: str, sort: Optional[Dict[str, int]] = None, limit: int = 1000) -> AsyncIterator[dict]:
+    # Authorize against the board and fetch its lists/cards in a single round trip.
+    # Mongo coalesces the $unwind into the $lookup, so big boards stream item by
+    # item instead of hitting the 16MB document limit. An authorized board with
+    # no items yields one empty document, an unauthorized one yields nothing.
+    pipeline = [{"$match": {"board_id": board_id}}]
+    if sort:
+        pipeline.append({"$sort": sort})
+    pipeline += [{"$limit": limit}, {"$project": {"_id": 0}}]
+    
+    cursor = db.boards.aggregate([
+        {"$match": {"id": board_id, "members": user_id}},
+        {"$lookup": {"from": collection, "pipeline": pipeline, "as": "items"}},
+        {"$unwind": {"path": "$items", "preserveNullAndEmptyArrays": True}},
+        {"$replaceRoot": {"newRoot": {"$ifNull": ["$items", {}]}}}
+    ])
+    first = await anext(cursor, None)
+    if first is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
+    return _chain_items(first, cursor)
+
+async def _chain_items(first: dict, cursor) -> AsyncIterator[dict]:
+    if not first:
+        return
+    yield first
+    async for doc in cursor:
+        yield doc
+
+async def get_board_items(board_id: str, user_id: str, collection: str, sort: Optional[Dict[str, int]] = None, limit: int = 1000) -> ListType[dict]:
+    return [doc async for doc in await iter_board_items(board_id, user_id, collection, sort, limit)]
+
+async def _json_array_chunks(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    separator = b"["
+    async for doc in docs:
+        yield separator + orjson.dumps(doc)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+def stream_json_array(docs: AsyncIterator[dict]) -> StreamingResponse:
+    # Encode documents as they come off the cursor instead of buffering the whole list
+    return StreamingResponse(_json_array_chunks(docs), media_type="application/json")
 
 # Auth Routes
 @api_router.post("/auth/register", response_model=TokenResponse)
@@ -179,8 +330,8 @@ async def register(user_data: UserCreate):
     
     user = User(email=user_data.email, name=user_data.name)
     user_dict = user.model_dump()
-    user_dict['password'] = hash_password(user_data.password)
-    user_dict['created_at'] = user_dict['created_at'].isoformat()
+    # bcrypt is CPU-bound; keep it off the event loop
+    user_dict['password'] = await asyncio.get_running_loop().run_in_executor(None, hash_password, user_data.password)
     
     await db.users.insert_one(user_dict)
     token = create_token(user.id)
@@ -189,214 +340,331 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user_doc = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user_doc or not verify_password(credentials.password, user_doc['password']):
+    if not user_doc or not await asyncio.get_running_loop().run_in_executor(None, verify_password, credentials.password, user_doc['password']):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     
-    if isinstance(user_doc.get('created_at'), str):
-        user_doc['created_at'] = datetime.fromisoformat(user_doc['created_at'])
-    
     user = User(**{k: v for k, v in user_doc.items() if k != 'password'})
     token = create_token(user.id)
     return TokenResponse(token=token, user=user)
 
 @api_router.get("/auth/me", response_model=User)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(current_user_from_state)):
     return current_user
 
 # Board Routes
 @api_router.post("/boards", response_model=Board)
-async def create_board(board_data: BoardCreate, current_user: User = Depends(get_current_user)):
+async def create_board(board_data: BoardCreate, current_user: User = Depends(current_user_from_state)):
     board = Board(**board_data.model_dump(), owner_id=current_user.id, members=[current_user.id])
     board_dict = board.model_dump()
-    board_dict['created_at'] = board_dict['created_at'].isoformat()
-    board_dict['updated_at'] = board_dict['updated_at'].isoformat()
     
     await db.boards.insert_one(board_dict)
     return board
 
+# Read handlers return Mongo documents as-is; response_model is kept for the
+# OpenAPI schema but returning a Response skips the dict -> model -> dict pass.
 @api_router.get("/boards", response_model=ListType[Board])
-async def get_boards(current_user: User = Depends(get_current_user)):
+async def get_boards(current_user: User = Depends(current_user_from_state)):
     boards = await db.boards.find({"members": current_user.id}, {"_id": 0}).to_list(1000)
-    for board in boards:
-        if isinstance(board.get('created_at'), str):
-            board['created_at'] = datetime.fromisoformat(board['created_at'])
-        if isinstance(board.get('updated_at'), str):
-            board['updated_at'] = datetime.fromisoformat(board['updated_at'])
-    return boards
+    return ORJSONResponse(boards)
 
 @api_router.get("/boards/{board_id}", response_model=Board)
-async def get_board(board_id: str, current_user: User = Depends(get_current_user)):
+async def get_board(board_id: str, current_user: User = Depends(current_user_from_state)):
     board = await db.boards.find_one({"id": board_id, "members": current_user.id}, {"_id": 0})
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
-    if isinstance(board.get('created_at'), str):
-        board['created_at'] = datetime.fromisoformat(board['created_at'])
-    if isinstance(board.get('updated_at'), str):
-        board['updated_at'] = datetime.fromisoformat(board['updated_at'])
-    return Board(**board)
+    return ORJSONResponse(board)
 
 @api_router.delete("/boards/{board_id}")
-async def delete_board(board_id: str, current_user: User = Depends(get_current_user)):
+async def delete_board(board_id: str, current_user: User = Depends(current_user_from_state)):
     board = await db.boards.find_one({"id": board_id, "owner_id": current_user.id})
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
     
-    await db.boards.delete_one({"id": board_id})
-    await db.lists.delete_many({"board_id": board_id})
-    await db.cards.delete_many({"board_id": board_id})
+    await asyncio.gather(
+        db.boards.delete_one({"id": board_id}),
+        db.lists.delete_many({"board_id": board_id}),
+        db.cards.delete_many({"board_id": board_id})
+    )
     return {"message": "Board deleted successfully"}
 
 # List Routes
 @api_router.post("/lists", response_model=List)
-async def create_list(list_data: ListCreate, current_user: User = Depends(get_current_user)):
+async def create_list(list_data: ListCreate, current_user: User = Depends(current_user_from_state)):
     board = await db.boards.find_one({"id": list_data.board_id, "members": current_user.id})
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
     
     list_obj = List(**list_data.model_dump())
     list_dict = list_obj.model_dump()
-    list_dict['created_at'] = list_dict['created_at'].isoformat()
     
     await db.lists.insert_one(list_dict)
     return list_obj
 
 @api_router.get("/lists/{board_id}", response_model=ListType[List])
-async def get_lists(board_id: str, current_user: User = Depends(get_current_user)):
-    board = await db.boards.find_one({"id": board_id, "members": current_user.id})
-    if not board:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
-    
-    lists = await db.lists.find({"board_id": board_id}, {"_id": 0}).sort("position", 1).to_list(1000)
-    for list_item in lists:
-        if isinstance(list_item.get('created_at'), str):
-            list_item['created_at'] = datetime.fromisoformat(list_item['created_at'])
-    return lists
+async def get_lists(board_id: str, current_user: User = Depends(current_user_from_state)):
+    lists = await get_board_items(board_id, current_user.id, "lists", sort={"position": 1})
+    return ORJSONResponse(lists)
 
 @api_router.delete("/lists/{list_id}")
-async def delete_list(list_id: str, current_user: User = Depends(get_current_user)):
-    list_obj = await db.lists.find_one({"id": list_id})
+async def delete_list(list_id: str, current_user: User = Depends(current_user_from_state)):
+    list_obj = await db.lists.find_one({"id": list_id, "board_id": {"$in": await get_member_board_ids(current_user.id)}})
     if not list_obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="List not found")
     
-    await db.lists.delete_one({"id": list_id})
-    await db.cards.delete_many({"list_id": list_id})
+    await asyncio.gather(
+        db.lists.delete_one({"id": list_id}),
+        db.cards.delete_many({"list_id": list_id, "board_id": list_obj['board_id']})
+    )
     return {"message": "List deleted successfully"}
 
 # Card Routes
 @api_router.post("/cards", response_model=Card)
-async def create_card(card_data: CardCreate, current_user: User = Depends(get_current_user)):
+async def create_card(card_data: CardCreate, current_user: User = Depends(current_user_from_state)):
     board = await db.boards.find_one({"id": card_data.board_id, "members": current_user.id})
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
     
     card = Card(**card_data.model_dump())
     card_dict = card.model_dump()
-    card_dict['created_at'] = card_dict['created_at'].isoformat()
-    card_dict['updated_at'] = card_dict['updated_at'].isoformat()
-    if card_dict.get('due_date'):
-        card_dict['due_date'] = card_dict['due_date'].isoformat()
     
     await db.cards.insert_one(card_dict)
     return card
 
-@api_router.get("/cards/{board_id}", response_model=ListType[Card])
-async def get_cards(board_id: str, current_user: User = Depends(get_current_user)):
-    board = await db.boards.find_one({"id": board_id, "members": current_user.id})
-    if not board:
+async def insert_cards(cards: ListType[Card]) -> None:
+    # One round trip for the whole set; unordered lets Mongo apply the writes in parallel
+    if cards:
+        await db.cards.insert_many([card.model_dump() for card in cards], ordered=False)
+
+@api_router.post("/cards/bulk", response_model=ListType[Card])
+async def create_cards(cards_data: ListType[CardCreate], current_user: User = Depends(current_user_from_state)):
+    if len(cards_data) > BULK_CARDS_MAX:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"Bulk create is limited to {BULK_CARDS_MAX} cards")
+    
+    board_ids = list({card_data.board_id for card_data in cards_data})
+    allowed = await db.boards.distinct("id", {"id": {"$in": board_ids}, "members": current_user.id})
+    if len(allowed) != len(board_ids):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
     
-    cards = await db.cards.find({"board_id": board_id}, {"_id": 0}).to_list(10000)
-    for card in cards:
-        if isinstance(card.get('created_at'), str):
-            card['created_at'] = datetime.fromisoformat(card['created_at'])
-        if isinstance(card.get('updated_at'), str):
-            card['updated_at'] = datetime.fromisoformat(card['updated_at'])
-        if card.get('due_date') and isinstance(card['due_date'], str):
-            card['due_date'] = datetime.fromisoformat(card['due_date'])
+    cards = [Card(**card_data.model_dump()) for card_data in cards_data]
+    await insert_cards(cards)
+    return cards
+
+async def create_cards_from_tasks(board_id: str, tasks: ListType[Dict[str, Any]], current_user: User) -> ListType[Card]:
+    # Extracted tasks go to the end of the board's first list
+    try:
+        parsed_tasks = EXTRACTED_TASKS_ADAPTER.validate_python(tasks)
+    except ValidationError:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="AI returned malformed tasks")
+    if len(parsed_tasks) > BULK_CARDS_MAX:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"AI returned more than {BULK_CARDS_MAX} tasks")
+    
+    lists = await get_board_items(board_id, current_user.id, "lists", sort={"position": 1}, limit=1)
+    if not lists:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Board has no lists")
+    list_id = lists[0]['id']
+    position = await db.cards.count_documents({"list_id": list_id})
+    
+    cards = [
+        Card(
+            title=task.title,
+            description=task.description,
+            priority=task.priority or "medium",
+            list_id=list_id,
+            board_id=board_id,
+            position=position + i
+        )
+        for i, task in enumerate(parsed_tasks)
+    ]
+    await insert_cards(cards)
     return cards
 
+@api_router.get("/cards/{board_id}", response_model=ListType[Card])
+async def get_cards(board_id: str, current_user: User = Depends(current_user_from_state)):
+    cards = await iter_board_items(board_id, current_user.id, "cards", limit=10000)
+    return stream_json_array(cards)
+
 @api_router.put("/cards/{card_id}", response_model=Card)
-async def update_card(card_id: str, card_update: CardUpdate, current_user: User = Depends(get_current_user)):
-    card = await db.cards.find_one({"id": card_id}, {"_id": 0})
-    if not card:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
+async def update_card(card_id: str, card_update: CardUpdate, current_user: User = Depends(current_user_from_state)):
+    card_filter = {"id": card_id, "board_id": {"$in": await get_member_board_ids(current_user.id)}}
     
     update_data = {k: v for k, v in card_update.model_dump(exclude_unset=True).items() if v is not None}
     if update_data:
-        update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-        if 'due_date' in update_data and update_data['due_date']:
-            update_data['due_date'] = update_data['due_date'].isoformat()
+        update_data['updated_at'] = datetime.now(timezone.utc)
         
-        await db.cards.update_one({"id": card_id}, {"$set": update_data})
-    
-    updated_card = await db.cards.find_one({"id": card_id}, {"_id": 0})
-    if isinstance(updated_card.get('created_at'), str):
-        updated_card['created_at'] = datetime.fromisoformat(updated_card['created_at'])
-    if isinstance(updated_card.get('updated_at'), str):
-        updated_card['updated_at'] = datetime.fromisoformat(updated_card['updated_at'])
-    if updated_card.get('due_date') and isinstance(updated_card['due_date'], str):
-        updated_card['due_date'] = datetime.fromisoformat(updated_card['due_date'])
+        updated_card = await db.cards.find_one_and_update(
+            card_filter,
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    else:
+        updated_card = await db.cards.find_one(card_filter, {"_id": 0})
+    if not updated_card:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
     return Card(**updated_card)
 
 @api_router.delete("/cards/{card_id}")
-async def delete_card(card_id: str, current_user: User = Depends(get_current_user)):
-    card = await db.cards.find_one({"id": card_id})
-    if not card:
+async def delete_card(card_id: str, current_user: User = Depends(current_user_from_state)):
+    result = await db.cards.delete_one({"id": card_id, "board_id": {"$in": await get_member_board_ids(current_user.id)}})
+    if not result.deleted_count:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
-    
-    await db.cards.delete_one({"id": card_id})
     return {"message": "Card deleted successfully"}
 
 # Inbox - Get all user's cards across boards
-@api_router.get("/inbox", response_model=ListType[Card])
-async def get_inbox(current_user: User = Depends(get_current_user)):
-    boards = await db.boards.find({"members": current_user.id}, {"_id": 0}).to_list(1000)
-    board_ids = [b['id'] for b in boards]
+@api_router.get("/inbox", response_model=ListType[CardSummary])
+async def get_inbox(limit: int = 200, before: Optional[datetime] = None, before_id: Optional[str] = None, current_user: User = Depends(current_user_from_state)):
+    limit = max(1, min(limit, INBOX_MAX_LIMIT))
+    query = {"board_id": {"$in": await get_member_board_ids(current_user.id)}}
+    # Cursor is the (created_at, id) of the last card seen; cards from one insert_many
+    # share a millisecond timestamp, so id breaks the tie.
+    if before and before_id:
+        query["$or"] = [
+            {"created_at": {"$lt": before}},
+            {"created_at": before, "id": {"$lt": before_id}}
+        ]
+    elif before:
+        query["created_at"] = {"$lt": before}
     
-    cards = await db.cards.find({"board_id": {"$in": board_ids}}, {"_id": 0}).sort("created_at", -1).to_list(10000)
-    for card in cards:
-        if isinstance(card.get('created_at'), str):
-            card['created_at'] = datetime.fromisoformat(card['created_at'])
-        if isinstance(card.get('updated_at'), str):
-            card['updated_at'] = datetime.fromisoformat(card['updated_at'])
-        if card.get('due_date') and isinstance(card['due_date'], str):
-            card['due_date'] = datetime.fromisoformat(card['due_date'])
-    return cards
+    # Served pre-sorted by the (board_id, created_at, id) index
+    cards = db.cards.find(query, CARD_SUMMARY_PROJECTION).sort([("created_at", -1), ("id", -1)]).limit(limit)
+    return stream_json_array(cards)
 
 # AI Task Extraction
+EXTRACTION_SYSTEM_MESSAGE = "You are a task extraction assistant. Extract actionable tasks from the given text. Return a JSON array of tasks with 'title', 'description', and 'priority' (low/medium/high) fields. Be concise and clear."
+EXTRACTION_MODEL = ("openai", "gpt-4o-mini")
+EXTRACTION_PROMPT = "Extract tasks from this text and return ONLY a valid JSON array:\n\n{text}\n\nFormat: [{{'title': '...', 'description': '...', 'priority': 'medium'}}]"
+
+def get_extraction_chat(user_id: str) -> LlmChat:
+    # Not cached: an LlmChat may keep its conversation, so a fresh one per call
+    # makes every extraction start from just the system prompt.
+    return LlmChat(
+        api_key=os.environ.get('EMERGENT_LLM_KEY'),
+        session_id=f"extract_{user_id}",
+        system_message=EXTRACTION_SYSTEM_MESSAGE
+    ).with_model(*EXTRACTION_MODEL)
+
+async def _run_task_extraction(text: str, current_user: User, cache_key: str) -> Dict[str, Any]:
+    chat = get_extraction_chat(current_user.id)
+    user_message = UserMessage(
+        text=EXTRACTION_PROMPT.format(text=text)
+    )
+    
+    response = await chat.send_message(user_message)
+    
+    # Parse response
+    response_text = response.strip()
+    if response_text.startswith('```'):
+        # Drop the opening and closing fence lines without splitting the whole reply
+        _, _, rest = response_text.partition('\n')
+        response_text, _, _ = rest.rpartition('\n')
+    
+    tasks = orjson.loads(response_text)
+    # Don't cache replies that aren't a usable task list
+    EXTRACTED_TASKS_ADAPTER.validate_python(tasks)
+    
+    result = {"tasks": tasks, "raw_response": response}
+    await db.ai_cache.replace_one(
+        {"_id": cache_key},
+        {"result": result, "created_at": datetime.now(timezone.utc)},
+        upsert=True
+    )
+    return result
+
 @api_router.post("/ai/extract-tasks")
-async def extract_tasks(request: AIExtractRequest, current_user: User = Depends(get_current_user)):
+async def extract_tasks(request: AIExtractRequest, current_user: User = Depends(current_user_from_state)):
     try:
-        api_key = os.environ.get('EMERGENT_LLM_KEY')
-        chat = LlmChat(
-            api_key=api_key,
-            session_id=f"extract_{current_user.id}",
-            system_message="You are a task extraction assistant. Extract actionable tasks from the given text. Return a JSON array of tasks with 'title', 'description', and 'priority' (low/medium/high) fields. Be concise and clear."
-        ).with_model("openai", "gpt-4o-mini")
-        
-        user_message = UserMessage(
-            text=f"Extract tasks from this text and return ONLY a valid JSON array:\n\n{request.text}\n\nFormat: [{{'title': '...', 'description': '...', 'priority': 'medium'}}]"
-        )
-        
-        response = await chat.send_message(user_message)
-        
-        # Parse response
-        import json
-        response_text = response.strip()
-        if response_text.startswith('```'):
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])
-        
-        tasks = json.loads(response_text)
-        
-        return {"tasks": tasks, "raw_response": response}
+        # Identical input under the same model and prompts maps to the same extraction,
+        # so reuse it; changing any of them moves to a fresh key
+        cache_key = hashlib.sha256(orjson.dumps(
+            [EXTRACTION_MODEL, EXTRACTION_SYSTEM_MESSAGE, EXTRACTION_PROMPT, request.text]
+        )).hexdigest()
+        cached = await db.ai_cache.find_one({"_id": cache_key})
+        if cached:
+            result = cached['result']
+        else:
+            result = await _run_task_extraction(request.text, current_user, cache_key)
     except Exception as e:
         logging.error(f"AI extraction error: {str(e)}")
         return {"tasks": [{"title": "Error extracting tasks", "description": str(e), "priority": "low"}], "error": str(e)}
+    
+    # Card creation errors surface as real HTTP errors, not as a failed extraction
+    if request.board_id:
+        cards = await create_cards_from_tasks(request.board_id, result['tasks'], current_user)
+        result = {**result, "cards": cards}
+    return result
+
+# Batch - run several API operations in one round trip, authenticating once.
+# Items run in order so later ones can rely on earlier writes; pass
+# ?concurrent=true when the items are independent of each other.
+def _resolve_batch_route(method: str, path: str):
+    full_path = "/api/" + path.lstrip('/')
+    for route in api_router.routes:
+        if not isinstance(route, APIRoute) or route.endpoint is batch:
+            continue
+        match = route.path_regex.match(full_path)
+        if match and method in route.methods:
+            return route, match.groupdict()
+    return None, None
+
+async def _read_body(response: Response) -> bytes:
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return response.body
+
+async def _run_batch_item(item: BatchItem, current_user: User) -> BatchResult:
+    path, _, query_string = item.path.partition('?')
+    route, path_params = _resolve_batch_route(item.method.upper(), path)
+    if route is None:
+        return BatchResult(status=status.HTTP_404_NOT_FOUND, body={"detail": "Not Found"})
+    query_params = dict(parse_qsl(query_string))
+    
+    try:
+        kwargs = {}
+        for name, param in inspect.signature(route.endpoint).parameters.items():
+            if name == 'current_user':
+                kwargs[name] = current_user
+            elif name in path_params:
+                kwargs[name] = path_params[name]
+            elif name in query_params:
+                kwargs[name] = TypeAdapter(param.annotation).validate_python(query_params[name])
+            elif param.default is inspect.Parameter.empty:
+                kwargs[name] = TypeAdapter(param.annotation).validate_python(item.body if item.body is not None else {})
+        
+        result = await route.endpoint(**kwargs)
+        
+        if isinstance(result, Response):
+            return BatchResult(status=result.status_code, body=orjson.loads(await _read_body(result)))
+        if route.response_model is not None:
+            adapter = TypeAdapter(route.response_model)
+            result = adapter.dump_python(adapter.validate_python(result), mode='json')
+        return BatchResult(status=status.HTTP_200_OK, body=jsonable_encoder(result))
+    except HTTPException as e:
+        return BatchResult(status=e.status_code, body={"detail": e.detail})
+    except ValidationError as e:
+        return BatchResult(status=status.HTTP_422_UNPROCESSABLE_ENTITY, body={"detail": jsonable_encoder(e.errors())})
+    except Exception:
+        logging.exception(f"Batch item {item.method} {item.path} failed")
+        return BatchResult(status=status.HTTP_500_INTERNAL_SERVER_ERROR, body={"detail": "Internal Server Error"})
+
+@api_router.post("/batch", response_model=ListType[BatchResult])
+async def batch(items: ListType[BatchItem], concurrent: bool = False, current_user: User = Depends(current_user_from_state)):
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"Batch is limited to {BATCH_MAX_ITEMS} items")
+    
+    if concurrent:
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+        
+        async def run_bounded(item: BatchItem) -> BatchResult:
+            async with semaphore:
+                return await _run_batch_item(item, current_user)
+        return await asyncio.gather(*(run_bounded(item) for item in items))
+    return [await _run_batch_item(item, current_user) for item in items]
 
 # Include router
 app.include_router(api_router)
 
+app.add_middleware(BearerAuthMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -411,6 +679,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def ensure_indexes():
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.boards.create_index("id", unique=True)
+    await db.boards.create_index([("members", 1)])
+    await db.lists.create_index("id", unique=True)
+    await db.lists.create_index([("board_id", 1), ("position", 1)])
+    await db.cards.create_index("id", unique=True)
+    await db.cards.create_index("list_id")
+    await db.cards.create_index([("board_id", 1), ("created_at", -1), ("id", -1)])
+    await db.ai_cache.create_index("created_at", expireAfterSeconds=AI_CACHE_TTL)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
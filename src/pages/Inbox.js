@@ -12,6 +12,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
+const INBOX_PAGE_SIZE = 200;
 
 export default function Inbox() {
   const navigate = useNavigate();
@@ -23,6 +24,8 @@ export default function Inbox() {
   const [extractedTasks, setExtractedTasks] = useState([]);
   const [selectedBoard, setSelectedBoard] = useState("");
   const [extracting, setExtracting] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchData();
@@ -34,11 +37,12 @@ export default function Inbox() {
       const headers = { Authorization: `Bearer ${token}` };
       
       const [cardsRes, boardsRes] = await Promise.all([
-        axios.get(`${API}/inbox`, { headers }),
+        axios.get(`${API}/inbox`, { headers, params: { limit: INBOX_PAGE_SIZE } }),
         axios.get(`${API}/boards`, { headers })
       ]);
       
       setCards(cardsRes.data);
+      setHasMore(cardsRes.data.length === INBOX_PAGE_SIZE);
       setBoards(boardsRes.data);
     } catch (error) {
       toast.error("Failed to load inbox");
@@ -47,6 +51,25 @@ export default function Inbox() {
     }
   };
 
+  const loadMore = async () => {
+    const last = cards[cards.length - 1];
+    setLoadingMore(true);
+    try {
+      const token = localStorage.getItem('token');
+      const response = await axios.get(`${API}/inbox`, {
+        headers: { Authorization: `Bearer ${token}` },
+        params: { limit: INBOX_PAGE_SIZE, before: last.created_at, before_id: last.id }
+      });
+      
+      setCards([...cards, ...response.data]);
+      setHasMore(response.data.length === INBOX_PAGE_SIZE);
+    } catch (error) {
+      toast.error("Failed to load more tasks");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const extractTasks = async () => {
     if (!inputText.trim()) {
       toast.error("Please enter some text");
@@ -93,16 +116,14 @@ export default function Inbox() {
       const cardsRes = await axios.get(`${API}/cards/${selectedBoard}`, { headers });
       let position = cardsRes.data.filter(c => c.list_id === firstList.id).length;
       
-      for (const task of extractedTasks) {
-        await axios.post(`${API}/cards`, {
-          title: task.title,
-          description: task.description || "",
-          list_id: firstList.id,
-          board_id: selectedBoard,
-          position: position++,
-          priority: task.priority || "medium"
-        }, { headers });
-      }
+      await axios.post(`${API}/cards/bulk`, extractedTasks.map(task => ({
+        title: task.title,
+        description: task.description || "",
+        list_id: firstList.id,
+        board_id: selectedBoard,
+        position: position++,
+        priority: task.priority || "medium"
+      })), { headers });
       
       toast.success(extractedTasks.length + " task(s) added to board!");
       setShowAIConverter(false);
@@ -250,6 +271,19 @@ export default function Inbox() {
                 </Card>
               );
             })}
+            {hasMore && (
+              <div className="text-center pt-4">
+                <Button
+                  data-testid="inbox-load-more-button"
+                  variant="outline"
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  style={{ color: '#0277bd', borderColor: '#b3e5fc' }}
+                >
+                  {loadingMore ? "Loading..." : "Load more"}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </main>
@@ -0,0 +1,78 @@
+import base64
+import time
+
+import jwt
+import orjson
+import pytest
+
+from auth_tokens import decode_hs256
+
+SECRET = "test-secret"
+KEY = SECRET.encode("utf-8")
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _token(payload, key=SECRET, algorithm="HS256"):
+    return jwt.encode(payload, key, algorithm=algorithm)
+
+
+def _valid_payload(**extra):
+    return {"user_id": "user-1", "exp": int(time.time()) + 3600, **extra}
+
+
+def test_valid_token_matches_pyjwt():
+    token = _token(_valid_payload())
+    assert decode_hs256(token, KEY) == jwt.decode(token, SECRET, algorithms=["HS256"])
+
+
+@pytest.mark.parametrize("key", [None, b""])
+def test_missing_secret_rejects_every_token(key):
+    forged = _token({"user_id": "victim", "exp": int(time.time()) + 3600}, key="")
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_hs256(forged, key)
+
+
+def test_token_signed_with_other_key_is_rejected():
+    forged = _token(_valid_payload(), key="attacker-secret")
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_hs256(forged, KEY)
+
+
+def test_alg_none_is_rejected():
+    header = _b64(orjson.dumps({"alg": "none", "typ": "JWT"}))
+    payload = _b64(orjson.dumps(_valid_payload()))
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        decode_hs256(f"{header}.{payload}.", KEY)
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = _token(_valid_payload()).split(".")
+    tampered = _b64(orjson.dumps(_valid_payload(user_id="victim")))
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_hs256(f"{header}.{tampered}.{signature}", KEY)
+
+
+def test_expired_token_is_rejected():
+    token = _token({"user_id": "user-1", "exp": int(time.time()) - 1})
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_hs256(token, KEY)
+
+
+def test_missing_exp_is_rejected():
+    token = _token({"user_id": "user-1"})
+    with pytest.raises(jwt.MissingRequiredClaimError):
+        decode_hs256(token, KEY)
+
+
+@pytest.mark.parametrize("token", ["", "a.b", "a.b.c.d", "not-a-token"])
+def test_wrong_segment_count_is_rejected(token):
+    with pytest.raises(jwt.DecodeError):
+        decode_hs256(token, KEY)
+
+
+def test_malformed_segments_are_rejected():
+    with pytest.raises(jwt.DecodeError):
+        decode_hs256("a.b.c", KEY)